@@ -359,7 +359,9 @@ pg_escape_bytea(PyObject *self, PyObject *data)
     Py_ssize_t from_length;   /* length of string */
     size_t to_length;         /* length of result */
     int encoding = -1;        /* client encoding */
+    Py_buffer view;           /* buffer of other bytes-like objects */
 
+    view.obj = NULL;
     if (PyBytes_Check(data)) {
         PyBytes_AsStringAndSize(data, &from, &from_length);
     }
@@ -370,6 +372,13 @@ pg_escape_bytea(PyObject *self, PyObject *data)
             return NULL; /* pass the UnicodeEncodeError */
         PyBytes_AsStringAndSize(tmp_obj, &from, &from_length);
     }
+    else if (PyObject_CheckBuffer(data)) {
+        /* use the data of bytearray or memoryview objects without a copy */
+        if (PyObject_GetBuffer(data, &view, PyBUF_SIMPLE) < 0)
+            return NULL;
+        from = (char *)view.buf;
+        from_length = view.len;
+    }
     else {
         PyErr_SetString(PyExc_TypeError,
                         "Method escape_bytea() expects a string as argument");
@@ -380,6 +389,8 @@ pg_escape_bytea(PyObject *self, PyObject *data)
                                &to_length);
 
     Py_XDECREF(tmp_obj);
+    if (view.obj)
+        PyBuffer_Release(&view);
 
     if (encoding == -1)
         to_obj = PyBytes_FromStringAndSize(to, (Py_ssize_t)to_length - 1);
@@ -133,17 +133,25 @@ class _ParameterList(list):
     """Helper class for building typed parameter lists."""
 
     adapt: Callable
+    adapt_inline: Callable | None = None
 
     def add(self, value: Any, typ:Any = None) -> str:
         """Typecast value with known database type and build parameter list.
 
         If this is a literal value, it will be returned as is.  Otherwise, a
         placeholder will be returned and the parameter list will be augmented.
+        If the list has been created for inline parameters, the quoted value
+        will be returned instead and the parameter list will stay empty.
         """
         # noinspection PyUnresolvedReferences
         value = self.adapt(value, typ)
         if isinstance(value, Literal):
             return value
+        adapt_inline = self.adapt_inline
+        if adapt_inline is not None:
+            if isinstance(value, bytes):  # escaped bytea
+                value = value.decode('ascii')
+            return str(adapt_inline(value))
         self.append(value)
         return f'${len(self)}'
 
@@ -608,14 +616,19 @@ class Adapter:
             value = self.adapt_inline(value)
         return value
 
-    def parameter_list(self) -> _ParameterList:
+    def parameter_list(self, inline: bool = False) -> _ParameterList:
         """Return a parameter list for parameters with known database types.
 
         The list has an add(value, typ) method that will build up the
         list and return either the literal value or a placeholder.
+
+        If inline is set to True, the add() method will return the adapted
+        values quoted as literals that can be put directly into the query.
         """
         params = _ParameterList()
         params.adapt = self.adapt
+        if inline:
+            params.adapt_inline = self.adapt_inline
         return params
 
     def format_query(self, command: str,
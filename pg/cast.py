@@ -66,6 +66,9 @@ def cast_num(value: str) -> Any:
     return (get_decimal() or float)(value)
 
 
+_re_not_money = regex(r'[^\d.-]+')
+
+
 def cast_money(value: str) -> Any:
     """Cast a money value."""
     point = get_decimal_point()
@@ -74,7 +77,7 @@ def cast_money(value: str) -> Any:
     if point != '.':
         value = value.replace(point, '.')
     value = value.replace('(', '-')
-    value = ''.join(c for c in value if c.isdigit() or c in '.-')
+    value = _re_not_money.sub('', value)
     return (get_decimal() or float)(value)
 
 
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from contextlib import suppress
+from contextlib import contextmanager, suppress
+from itertools import islice
 from json import dumps as jsonencode
 from json import loads as jsondecode
 from operator import itemgetter
@@ -10,6 +11,7 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Iterable,
     Iterator,
     Sequence,
     TypeVar,
@@ -29,7 +31,7 @@ from .core import (
     unescape_bytea,
 )
 from .error import db_error, int_error, prg_error
-from .helpers import namediter, oid_key, quote_if_unqualified
+from .helpers import columniter, namediter, oid_key, quote_if_unqualified
 from .notify import NotificationHandler
 
 if TYPE_CHECKING:
@@ -42,6 +44,14 @@ except TypeError:  # Python < 3.10
 
 __all__ = ['DB']
 
+# Maximum number of parameters that can be passed with one command
+_max_params = 65535
+
+# Types that must be cast without their default length restriction
+_unbounded_types = {
+    'bit': 'varbit', '_bit': 'varbit[]',
+    'bpchar': 'bpchar', '_bpchar': 'bpchar[]'}
+
 
 # The actual PostgreSQL database connection interface:
 
@@ -114,6 +124,14 @@ class DB:
         self._generated: dict[str, frozenset[str]] = {}
         self._pkeys: dict[str, str | tuple[str, ...]] = {}
         self._privileges: dict[tuple[str, str], bool] = {}
+        self._where_templates: dict[tuple[str, ...], str] = {}
+        self._commands: dict[tuple[str, str], tuple[str, ...]] = {}
+        self._clear_values: dict[tuple[str, bool], dict[str, Any]] = {}
+        self._upsert_columns: dict[str, dict[str, tuple[str, str]]] = {}
+        self._pipeline: list[tuple[str, dict[str, Any], str | None,
+                                   str | None]] | None = None
+        self._safe_operator = True
+        self._eq_op = ' OPERATOR(pg_catalog.=) '
         self.adapter = Adapter(self)
         self.dbtypes = DbTypes(self)
         self._query_attnames = (
@@ -215,6 +233,119 @@ class DB:
             s = self.escape_identifier(s)
         return s
 
+    def _where_template(self, keynames: tuple[str, ...]) -> str:
+        """Get a format string for a WHERE clause with the given key columns.
+
+        The returned string contains numbered replacement fields for the
+        parameters corresponding to the key columns.  Since it depends only
+        on the names of the key columns, it is cached by these names.
+        """
+        templates = self._where_templates
+        try:
+            return templates[keynames]
+        except KeyError:
+            col = self.escape_identifier
+            template = ' AND '.join(
+                col(k).replace('{', '{{').replace('}', '}}')
+                + f'{self._eq_op}{{{i}}}'
+                for i, k in enumerate(keynames))
+            templates[keynames] = template
+            return template
+
+    def _command_parts(self, op: str, table: str, qoid: str | None
+                       ) -> tuple[str, ...]:
+        """Get the static parts of an insert, update or upsert command.
+
+        These parts only depend on the metadata of the given table, so they
+        are cached until the primary key or attribute names are flushed.
+        """
+        commands = self._commands
+        try:
+            return commands[op, table]
+        except KeyError:
+            t = self._escape_qualified_name(table)
+            ret = ' RETURNING oid, *' if qoid else ' RETURNING *'
+            parts: tuple[str, ...]
+            if op == 'insert':
+                parts = f'INSERT INTO {t} (', ') VALUES (', ')' + ret
+            elif op == 'update':
+                parts = f'UPDATE {t} SET ', ' WHERE ', ret  # noqa: S608
+            elif op == 'upsert':
+                col = self.escape_identifier
+                target = ', '.join(col(k) for k in self.pkeys(table))
+                parts = (f'INSERT INTO {t} AS included (', ') VALUES (',
+                         f') ON CONFLICT ({target}) DO ', ret)
+            else:
+                raise ValueError(f'Invalid command: {op}') from None
+            commands[op, table] = parts
+            return parts
+
+    def _query_returning(self, cmd: str, params: Sequence,
+                         row: dict[str, Any], qoid: str | None,
+                         table: str | None = None) -> dict[str, Any]:
+        """Run a command returning a row and update the row dict with it.
+
+        If the command does not return a row and a table name is passed,
+        the row is fetched from the table instead.  If a pipeline is
+        active, the command is only queued and the row will be updated
+        when the pipeline is run.
+        """
+        pipeline = self._pipeline
+        if pipeline is not None:
+            if self.debug:
+                self._do_debug(cmd)
+            pipeline.append((cmd, row, qoid, table))
+            return row
+        if self.debug:
+            self._do_debug(cmd, params)
+        res = self._valid_db.query(cmd, params).dictresult()
+        self._update_row(row, res, qoid, table)
+        return row
+
+    def _update_row(self, row: dict[str, Any], res: list[dict[str, Any]],
+                    qoid: str | None, table: str | None) -> None:
+        """Update the row dict with the first row of a result."""
+        if res:
+            result = res[0]
+            if qoid:
+                result[qoid] = result.pop('oid')
+            row.update(result)
+        elif table:
+            self.get(table, row)
+
+    def _run_pipeline(self, pipeline: list[tuple[
+            str, dict[str, Any], str | None, str | None]]) -> None:
+        """Send all queued commands at once and update their rows."""
+        cmd = ';\n'.join(item[0] for item in pipeline)
+        query = self._valid_db.send_query(cmd)
+        results = []
+        while True:
+            res = query.dictresult()
+            if res is None:
+                break
+            results.append(res)
+        if len(results) != len(pipeline):
+            raise int_error(
+                f'Pipeline returned {len(results)} results'
+                f' for {len(pipeline)} commands')
+        update_row = self._update_row
+        for (_cmd, row, qoid, table), res in zip(pipeline, results):
+            update_row(row, res, qoid, table)
+
+    @staticmethod
+    def _oid_in(row: dict[str, Any], qoid: str | None) -> None:
+        """Copy the munged OID of the row to the plain oid key if needed."""
+        if qoid and qoid in row and 'oid' not in row:
+            row['oid'] = row[qoid]
+
+    @staticmethod
+    def _oid_out(row: dict[str, Any], qoid: str | None) -> None:
+        """Move the plain oid key of the row to the munged OID key."""
+        if 'oid' in row:
+            if qoid:
+                row[qoid] = row['oid']
+            del row['oid']
+
     @staticmethod
     def _make_bool(d: Any) -> bool | str:
         """Get boolean value corresponding to d."""
@@ -235,6 +366,27 @@ class DB:
 
     # Public methods
 
+    @property
+    def safe_operator(self) -> bool:
+        """Check whether key columns are compared using a qualified operator.
+
+        If this is True (the default), the methods get(), update() and
+        delete() compare the key columns using OPERATOR(pg_catalog.=), so
+        that they cannot be fooled by an equality operator defined in some
+        other schema on the search path.  If you know that there is no such
+        hazard, you can set this to False to use a plain equal sign instead.
+        """
+        return self._safe_operator
+
+    @safe_operator.setter
+    def safe_operator(self, safe: bool) -> None:
+        """Set whether key columns are compared using a qualified operator."""
+        safe = bool(safe)
+        if safe != self._safe_operator:
+            self._safe_operator = safe
+            self._eq_op = ' OPERATOR(pg_catalog.=) ' if safe else ' = '
+            self._where_templates.clear()
+
     # escape_string and escape_bytea exist as methods,
     # so we define unescape_bytea as a method as well
     unescape_bytea = staticmethod(unescape_bytea)
@@ -577,6 +729,8 @@ class DB:
         pkeys = self._pkeys
         if flush:
             pkeys.clear()
+            self._commands.clear()
+            self._upsert_columns.clear()
             self._do_debug('The pkey cache has been flushed')
         try:  # cache lookup
             pkey = pkeys[table]
@@ -672,6 +826,9 @@ class DB:
         attnames = self._attnames
         if flush:
             attnames.clear()
+            self._commands.clear()
+            self._clear_values.clear()
+            self._upsert_columns.clear()
             self._do_debug('The attnames cache has been flushed')
         try:  # cache lookup
             names = attnames[table]
@@ -699,6 +856,7 @@ class DB:
         generated = self._generated
         if flush:
             generated.clear()
+            self._upsert_columns.clear()
             self._do_debug('The generated cache has been flushed')
         try:  # cache lookup
             names = generated[table]
@@ -720,6 +878,7 @@ class DB:
         if regtypes != self.dbtypes._regtypes:
             self.dbtypes._regtypes = regtypes
             self._attnames.clear()
+            self._clear_values.clear()
             self.dbtypes.clear()
         return regtypes
 
@@ -770,8 +929,8 @@ class DB:
         qoid = oid_key(table) if 'oid' in attnames else None
         if keyname and isinstance(keyname, str):
             keyname = (keyname,)
-        if qoid and isinstance(row, dict) and qoid in row and 'oid' not in row:
-            row['oid'] = row[qoid]
+        if qoid and isinstance(row, dict):
+            self._oid_in(row, qoid)
         if not keyname:
             try:  # if keyname is not specified, try using the primary key
                 keyname = self.pkeys(table)
@@ -784,7 +943,8 @@ class DB:
                         f'Table {table} has no primary key') from e
             else:  # the table has a primary key
                 # check whether all key columns have values
-                if isinstance(row, dict) and not set(keyname).issubset(row):
+                if isinstance(row, dict) and not all(
+                        k in row for k in keyname):
                     # try using the oid instead
                     if qoid and 'oid' in row:
                         keyname = ('oid',)
@@ -793,37 +953,33 @@ class DB:
                             'Missing value in row for specified keyname')
         if not isinstance(row, dict):
             if not isinstance(row, (tuple, list)):
-                row = [row]
+                row = (row,)
             if len(keyname) != len(row):
                 raise KeyError(
                     'Differing number of items in keyname and row')
             row = dict(zip(keyname, row))
         params = self.adapter.parameter_list()
         adapt = params.add
-        col = self.escape_identifier
         what = 'oid, *' if qoid else '*'
-        where = ' AND '.join(
-            f'{col(k)} OPERATOR(pg_catalog.=) {adapt(row[k], attnames[k])}'
-            for k in keyname)
-        if 'oid' in row:
-            if qoid:
-                row[qoid] = row['oid']
-            del row['oid']
+        where = self._where_template(tuple(keyname)).format(
+            *[adapt(row[k], attnames[k]) for k in keyname])
+        self._oid_out(row, qoid)
         t = self._escape_qualified_name(table)
         cmd = f'SELECT {what} FROM {t} WHERE {where} LIMIT 1'  # noqa: S608s
-        self._do_debug(cmd, params)
+        if self.debug:
+            self._do_debug(cmd, params)
         query = self._valid_db.query(cmd, params)
         res = query.dictresult()
         if not res:
             # make where clause in error message better readable
-            where = where.replace('OPERATOR(pg_catalog.=)', '=')
+            where = where.replace(self._eq_op, ' = ')
             raise db_error(
                 f'No such record in {table}\nwhere {where}\nwith '
                 + self._list_params(params))
-        for n, value in res[0].items():
-            if qoid and n == 'oid':
-                n = qoid
-            row[n] = value
+        result = res[0]
+        if qoid:
+            result[qoid] = result.pop('oid')
+        row.update(result)
         return row
 
     def insert(self, table: str, row: dict[str, Any] | None = None, **kw: Any
@@ -850,30 +1006,22 @@ class DB:
         attnames = self.get_attnames(table)
         generated = self.get_generated(table)
         qoid = oid_key(table) if 'oid' in attnames else None
-        params = self.adapter.parameter_list()
+        params = self.adapter.parameter_list(
+            inline=self._pipeline is not None)
         adapt = params.add
         col = self.escape_identifier
         name_list, value_list = [], []
-        for n in attnames:
+        for n, t in attnames.items():
             if n in row and n not in generated:
                 name_list.append(col(n))
-                value_list.append(adapt(row[n], attnames[n]))
+                value_list.append(adapt(row[n], t))
         if not name_list:
             raise prg_error('No column found that can be inserted')
         names, values = ', '.join(name_list), ', '.join(value_list)
-        ret = 'oid, *' if qoid else '*'
-        t = self._escape_qualified_name(table)
-        cmd = (f'INSERT INTO {t} ({names})'  # noqa: S608
-               f' VALUES ({values}) RETURNING {ret}')
-        self._do_debug(cmd, params)
-        query = self._valid_db.query(cmd, params)
-        res = query.dictresult()
-        if res:  # this should always be true
-            for n, value in res[0].items():
-                if qoid and n == 'oid':
-                    n = qoid
-                row[n] = value
-        return row
+        into, values_clause, returning = self._command_parts(
+            'insert', table, qoid)
+        cmd = ''.join((into, names, values_clause, values, returning))
+        return self._query_returning(cmd, params, row, qoid)
 
     def update(self, table: str, row: dict[str, Any] | None = None, **kw : Any
                ) -> dict[str, Any]:
@@ -897,50 +1045,105 @@ class DB:
         elif 'oid' in row:
             del row['oid']  # only accept oid key from named args for safety
         row.update(kw)
-        if qoid and qoid in row and 'oid' not in row:
-            row['oid'] = row[qoid]
+        self._oid_in(row, qoid)
         if qoid and 'oid' in row:  # try using the oid
             keynames: tuple[str, ...] = ('oid',)
-            keyset = set(keynames)
         else:  # try using the primary key
             try:
                 keynames = self.pkeys(table)
             except KeyError as e:  # the table has no primary key
                 raise prg_error(f'Table {table} has no primary key') from e
-            keyset = set(keynames)
             # check whether all key columns have values
-            if not keyset.issubset(row):
+            if not all(k in row for k in keynames):
                 raise KeyError('Missing value for primary key in row')
-        params = self.adapter.parameter_list()
+        key_values = [row[k] for k in keynames]
+        self._oid_out(row, qoid)
+        keyset = frozenset(keynames)
+        names = [n for n in attnames
+                 if n in row and n not in keyset and n not in generated]
+        if not names:  # nothing to update
+            return row
+        params = self.adapter.parameter_list(
+            inline=self._pipeline is not None)
         adapt = params.add
         col = self.escape_identifier
-        where = ' AND '.join(
-            f'{col(k)} OPERATOR(pg_catalog.=) {adapt(row[k], attnames[k])}'
-            for k in keynames)
-        if 'oid' in row:
-            if qoid:
-                row[qoid] = row['oid']
-            del row['oid']
+        where = self._where_template(keynames).format(
+            *[adapt(v, attnames[k]) for k, v in zip(keynames, key_values)])
         values_list = []
-        for n in attnames:
-            if n in row and n not in keyset and n not in generated:
-                values_list.append(f'{col(n)} = {adapt(row[n], attnames[n])}')
-        if not values_list:
-            return row
+        for n in names:
+            values_list.append(f'{col(n)} = {adapt(row[n], attnames[n])}')
         values = ', '.join(values_list)
-        ret = 'oid, *' if qoid else '*'
+        update_set, where_clause, returning = self._command_parts(
+            'update', table, qoid)
+        cmd = ''.join((update_set, values, where_clause, where, returning))
+        # the result may be empty when the row does not exist
+        return self._query_returning(cmd, params, row, qoid)
+
+    def update_many(self, table: str, rows: Iterable[dict[str, Any]]) -> int:
+        """Update several existing rows in a database table.
+
+        Similar to update, but updates all rows passed as dictionaries
+        using as few commands as possible.  The rows are grouped by the
+        columns that shall be updated, and each group is updated with an
+        UPDATE ... FROM (VALUES ...) command.  The rows are identified by
+        the primary key of the table, so all key columns must be present
+        in each row.  Unlike update, the dictionaries are not modified.
+
+        The return value is the total number of rows that have been updated.
+        """
+        if table.endswith('*'):
+            table = table[:-1].rstrip()  # need parent table name
+        attnames = self.get_attnames(table)
+        generated = self.get_generated(table)
+        try:
+            keynames = self.pkeys(table)
+        except KeyError as e:  # the table has no primary key
+            raise prg_error(f'Table {table} has no primary key') from e
+        keyset = frozenset((*keynames, 'oid'))
+        groups: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+        for row in rows:
+            if not all(k in row for k in keynames):
+                raise KeyError('Missing value for primary key in row')
+            names = tuple(
+                n for n in attnames
+                if n in row and n not in keyset and n not in generated)
+            if names:
+                groups.setdefault(names, []).append(row)
+        if not groups:
+            return 0
+        col = self.escape_identifier
         t = self._escape_qualified_name(table)
-        cmd = (f'UPDATE {t} SET {values}'  # noqa: S608
-               f' WHERE {where} RETURNING {ret}')
-        self._do_debug(cmd, params)
-        query = self._valid_db.query(cmd, params)
-        res = query.dictresult()
-        if res:  # may be empty when row does not exist
-            for n, value in res[0].items():
-                if qoid and n == 'oid':
-                    n = qoid
-                row[n] = value
-        return row
+        eq_op = self._eq_op
+        where = ' AND '.join(
+            f'dst.{col(k)}{eq_op}src.{col(k)}' for k in keynames)
+        parameter_list = self.adapter.parameter_list
+        query = self._valid_db.query
+        count = 0
+        for names, group in groups.items():
+            columns = (*keynames, *names)
+            casts = [
+                '::' + _unbounded_types.get(attnames[n].pgtype,
+                                            attnames[n].regtype)
+                for n in columns]
+            types = [attnames[n] for n in columns]
+            values_set = ', '.join(f'{col(n)} = src.{col(n)}' for n in names)
+            src = ', '.join(map(col, columns))
+            size = max(_max_params // len(columns), 1)
+            for start in range(0, len(group), size):
+                params = parameter_list()
+                adapt = params.add
+                values = ', '.join(
+                    '({})'.format(', '.join(
+                        adapt(row[n], typ) + cast
+                        for n, typ, cast in zip(columns, types, casts)))
+                    for row in group[start:start + size])
+                cmd = (f'UPDATE {t} AS dst SET {values_set}'  # noqa: S608
+                       f' FROM (VALUES {values}) AS src({src})'
+                       f' WHERE {where}')
+                if self.debug:
+                    self._do_debug(cmd, params)
+                count += int(query(cmd, params))  # type: ignore
+        return count
 
     def upsert(self, table: str, row: dict[str, Any] | None = None, **kw: Any
                ) -> dict[str, Any]:
@@ -998,49 +1201,44 @@ class DB:
         attnames = self.get_attnames(table)
         generated = self.get_generated(table)
         qoid = oid_key(table) if 'oid' in attnames else None
-        params = self.adapter.parameter_list()
+        params = self.adapter.parameter_list(
+            inline=self._pipeline is not None)
         adapt = params.add
         col = self.escape_identifier
         name_list, value_list = [], []
-        for n in attnames:
+        for n, t in attnames.items():
             if n in row and n not in generated:
                 name_list.append(col(n))
-                value_list.append(adapt(row[n], attnames[n]))
+                value_list.append(adapt(row[n], t))
         names, values = ', '.join(name_list), ', '.join(value_list)
         try:
             keynames = self.pkeys(table)
         except KeyError as e:
             raise prg_error(f'Table {table} has no primary key') from e
-        target = ', '.join(col(k) for k in keynames)
+        upsert_columns = self._upsert_columns
+        try:  # cache lookup
+            columns = upsert_columns[table]
+        except KeyError:  # cache miss, get the columns that can be updated
+            keyset = frozenset((*keynames, 'oid'))
+            columns = {n: (col(n), f'excluded.{col(n)}') for n in attnames
+                       if n not in keyset and n not in generated}
+            upsert_columns[table] = columns  # cache it
         update = []
-        keyset = set(keynames)
-        keyset.add('oid')
-        for n in attnames:
-            if n not in keyset and n not in generated:
-                value = kw.get(n, n in row)
-                if value:
-                    if not isinstance(value, str):
-                        value = f'excluded.{col(n)}'
-                    update.append(f'{col(n)} = {value}')
+        for n, (c, excluded) in columns.items():
+            value = kw.get(n, n in row)
+            if value:
+                if not isinstance(value, str):
+                    value = excluded
+                update.append(f'{c} = {value}')
         if not values:
             return row
         do = 'update set ' + ', '.join(update) if update else 'nothing'
-        ret = 'oid, *' if qoid else '*'
-        t = self._escape_qualified_name(table)
-        cmd = (f'INSERT INTO {t} AS included ({names})'  # noqa: S608
-               f' VALUES ({values})'
-               f' ON CONFLICT ({target}) DO {do} RETURNING {ret}')
-        self._do_debug(cmd, params)
-        query = self._valid_db.query(cmd, params)
-        res = query.dictresult()
-        if res:  # may be empty with "do nothing"
-            for n, value in res[0].items():
-                if qoid and n == 'oid':
-                    n = qoid
-                row[n] = value
-        else:
-            self.get(table, row)
-        return row
+        into, values_clause, on_conflict, returning = self._command_parts(
+            'upsert', table, qoid)
+        cmd = ''.join((into, names, values_clause, values,
+                       on_conflict, do, returning))
+        # the result may be empty with "do nothing", then get the row
+        return self._query_returning(cmd, params, row, qoid, table)
 
     def clear(self, table: str, row: dict[str, Any] | None = None
               ) -> dict[str, Any]:
@@ -1054,17 +1252,19 @@ class DB:
         # At some point we will need a way to get defaults from a table.
         if row is None:
             row = {}  # empty if argument is not present
-        attnames = self.get_attnames(table)
-        for n, t in attnames.items():
-            if n == 'oid':
-                continue
-            t = t.simple
-            if t in DbTypes._num_types:
-                row[n] = 0
-            elif t == 'bool':
-                row[n] = self._make_bool(False)
-            else:
-                row[n] = ''
+        clear_values = self._clear_values
+        key = table, get_bool()
+        try:  # cache lookup
+            values = clear_values[key]
+        except KeyError:  # cache miss, compute the values from the types
+            num_types = DbTypes._num_types
+            false = self._make_bool(False)
+            values = {n: 0 if t.simple in num_types else
+                      false if t.simple == 'bool' else ''
+                      for n, t in self.get_attnames(table).items()
+                      if n != 'oid'}
+            clear_values[key] = values  # cache it
+        row.update(values)
         return row
 
     def delete(self, table: str, row: dict[str, Any] | None = None, **kw: Any
@@ -1090,8 +1290,7 @@ class DB:
         elif 'oid' in row:
             del row['oid']  # only accept oid key from named args for safety
         row.update(kw)
-        if qoid and qoid in row and 'oid' not in row:
-            row['oid'] = row[qoid]
+        self._oid_in(row, qoid)
         if qoid and 'oid' in row:  # try using the oid
             keynames: tuple[str, ...] = ('oid',)
         else:  # try using the primary key
@@ -1100,21 +1299,17 @@ class DB:
             except KeyError as e:  # the table has no primary key
                 raise prg_error(f'Table {table} has no primary key') from e
             # check whether all key columns have values
-            if not set(keynames).issubset(row):
+            if not all(k in row for k in keynames):
                 raise KeyError('Missing value for primary key in row')
         params = self.adapter.parameter_list()
         adapt = params.add
-        col = self.escape_identifier
-        where = ' AND '.join(
-            f'{col(k)} OPERATOR(pg_catalog.=) {adapt(row[k], attnames[k])}'
-            for k in keynames)
-        if 'oid' in row:
-            if qoid:
-                row[qoid] = row['oid']
-            del row['oid']
+        where = self._where_template(keynames).format(
+            *[adapt(row[k], attnames[k]) for k in keynames])
+        self._oid_out(row, qoid)
         t = self._escape_qualified_name(table)
         cmd = f'DELETE FROM {t} WHERE {where}'  # noqa: S608
-        self._do_debug(cmd, params)
+        if self.debug:
+            self._do_debug(cmd, params)
         res = self._valid_db.query(cmd, params)
         return int(res)  # type: ignore
 
@@ -1167,12 +1362,11 @@ class DB:
             if u:
                 t = f'ONLY {t}'
             tables.append(t)
-        cmd_parts = ['TRUNCATE', ', '.join(tables)]
+        cmd = 'TRUNCATE ' + ', '.join(tables)
         if restart:
-            cmd_parts.append('RESTART IDENTITY')
+            cmd += ' RESTART IDENTITY'
         if cascade:
-            cmd_parts.append('CASCADE')
-        cmd = ' '.join(cmd_parts)
+            cmd += ' CASCADE'
         self._do_debug(cmd)
         return self._valid_db.query(cmd)
 
@@ -1220,11 +1414,11 @@ class DB:
                 order = what
         else:
             what = '*'
-        cmd_parts = ['SELECT', what, 'FROM', table]
+        cmd = f'SELECT {what} FROM {table}'  # noqa: S608
         if where:
             if isinstance(where, (list, tuple)):
                 where = ' AND '.join(map(str, where))
-            cmd_parts.extend(['WHERE', where])
+            cmd += f' WHERE {where}'
         if order is None or order is True:
             try:
                 order = self.pkeys(table)
@@ -1234,12 +1428,11 @@ class DB:
         if order and not isinstance(order, bool):
             if isinstance(order, (list, tuple)):
                 order = ', '.join(map(str, order))
-            cmd_parts.extend(['ORDER BY', order])
+            cmd += f' ORDER BY {order}'
         if limit:
-            cmd_parts.append(f'LIMIT {limit}')
+            cmd += f' LIMIT {limit}'
         if offset:
-            cmd_parts.append(f'OFFSET {offset}')
-        cmd = ' '.join(cmd_parts)
+            cmd += f' OFFSET {offset}'
         self._do_debug(cmd)
         query = self._valid_db.query(cmd)
         res = query.namedresult()
@@ -1292,28 +1485,27 @@ class DB:
                 order = what
         else:
             what = '*'
-        cmd_parts = ['SELECT', what, 'FROM', table]
+        cmd = f'SELECT {what} FROM {table}'  # noqa: S608
         if where:
             if isinstance(where, (list, tuple)):
                 where = ' AND '.join(map(str, where))
-            cmd_parts.extend(['WHERE', where])
+            cmd += f' WHERE {where}'
         if order is None or order is True:
             order = keyname
         if order and not isinstance(order, bool):
             if isinstance(order, (list, tuple)):
                 order = ', '.join(map(str, order))
-            cmd_parts.extend(['ORDER BY', order])
+            cmd += f' ORDER BY {order}'
         if limit:
-            cmd_parts.append(f'LIMIT {limit}')
+            cmd += f' LIMIT {limit}'
         if offset:
-            cmd_parts.append(f'OFFSET {offset}')
-        cmd = ' '.join(cmd_parts)
+            cmd += f' OFFSET {offset}'
         self._do_debug(cmd)
         query = self._valid_db.query(cmd)
         res = query.getresult()
         if not res:
             return {}
-        keyset = set(keynames)
+        keyset = frozenset(keynames)
         fields = query.listfields()
         if not keyset.issubset(fields):
             raise KeyError('Missing keyname in row')
@@ -1324,31 +1516,47 @@ class DB:
         key_tuple = len(key_index) > 1
         get_key = itemgetter(*key_index)
         keys = map(get_key, res)
+        rows: Iterator[Any]
         if scalar:
-            row_index = row_index[:1]
+            rows = map(itemgetter(*row_index[:1]), res)
             row_is_tuple = False
         else:
-            row_is_tuple = len(row_index) > 1
-        if scalar or row_is_tuple:
-            get_row: Callable[[tuple], tuple] = itemgetter(  # pyright: ignore
-                *row_index)
-        else:
-            frst_index = row_index[0]
-
-            def get_row(row : tuple) -> tuple:
-                return row[frst_index],  # tuple with one item
-
+            if len(row_index) > 1:
+                rows = map(itemgetter(*row_index), res)
+            else:  # zip() over one iterable makes tuples with one item
+                rows = zip(map(itemgetter(row_index[0]), res))
             row_is_tuple = True
-        rows = map(get_row, res)
         if key_tuple or row_is_tuple:
             if key_tuple:
                 keys = namediter(_MemoryQuery(keys, keynames))  # type: ignore
             if row_is_tuple:
-                fields = tuple(f for f in fields if f not in keyset)
+                fields = tuple(fields[i] for i in row_index)
                 rows = namediter(_MemoryQuery(rows, fields))  # type: ignore
         # noinspection PyArgumentList
         return dict(zip(keys, rows))
 
+    def chunked(self, query: Query, size: int = 1000
+                ) -> Iterator[list[tuple]]:
+        """Iterate over the rows of a query result in chunks of given size.
+
+        The rows are returned as lists of tuples with at most the given
+        number of rows, so that they can be processed in batches without
+        creating the Python objects for all rows of the result at once.
+        """
+        if size < 1:
+            raise ValueError('The chunk size must be positive')
+        rows = iter(query)
+        return iter(lambda: list(islice(rows, size)), [])
+
+    def columns(self, query: Query, *names: str) -> Iterator[tuple]:
+        """Iterate over the given columns of a query result.
+
+        The values of the columns with the given names are returned
+        as plain tuples for each row, without creating named tuples
+        or dictionaries for the rows.
+        """
+        return columniter(query, *names)
+
     def notification_handler(self, event: str, callback: Callable,
                              arg_dict: dict | None = None,
                              timeout: int | float | None = None,
@@ -1358,6 +1566,29 @@ class DB:
         return NotificationHandler(self, event, callback,
                                    arg_dict, timeout, stop_event)
 
+    @contextmanager
+    def pipeline(self) -> Iterator[DB]:
+        """Collect insert, update and upsert commands and send them at once.
+
+        Inside the context, the insert(), update() and upsert() methods
+        do not send their commands immediately, but queue them with their
+        parameters inlined.  When the context is left without an error,
+        all queued commands are sent to the database in one round-trip,
+        and the passed row dictionaries are updated with the results.
+        Since the commands are run as one implicit transaction, an error
+        in one of the commands will roll back all of them.
+        """
+        if self._pipeline is not None:
+            raise int_error('A pipeline is already active')
+        self._pipeline = []
+        pipeline = self._pipeline
+        try:
+            yield self
+        finally:
+            self._pipeline = None
+        if pipeline:
+            self._run_pipeline(pipeline)
+
     # immediately wrapped methods
 
     def send_query(self, cmd: str, args: Sequence | None = None) -> Query:
@@ -1428,19 +1659,35 @@ class DB:
 
     def escape_literal(self, s: AnyStr) -> AnyStr:
         """Escape a literal constant for use within SQL."""
-        return self._valid_db.escape_literal(s)
+        db = self.db  # avoid the overhead of the _valid_db property
+        if not db:
+            raise int_error('Connection already closed')
+        return db.escape_literal(s)
 
     def escape_identifier(self, s: AnyStr) -> AnyStr:
         """Escape an identifier for use within SQL."""
-        return self._valid_db.escape_identifier(s)
+        db = self.db
+        if not db:
+            raise int_error('Connection already closed')
+        return db.escape_identifier(s)
 
     def escape_string(self, s: AnyStr) -> AnyStr:
         """Escape a string for use within SQL."""
-        return self._valid_db.escape_string(s)
+        db = self.db
+        if not db:
+            raise int_error('Connection already closed')
+        return db.escape_string(s)
 
     def escape_bytea(self, s: AnyStr) -> AnyStr:
-        """Escape binary data for use within SQL as type 'bytea'."""
-        return self._valid_db.escape_bytea(s)
+        """Escape binary data for use within SQL as type 'bytea'.
+
+        Besides bytes and str, bytes-like objects such as bytearray or
+        memoryview can be passed without copying them first.
+        """
+        db = self.db
+        if not db:
+            raise int_error('Connection already closed')
+        return db.escape_bytea(s)
 
     def putline(self, line: str) -> None:
         """Write a line to the server socket."""
@@ -1480,7 +1727,11 @@ class DB:
 
 
 class _MemoryQuery:
-    """Class that embodies a given query result."""
+    """Class that embodies a given query result.
+
+    The result is stored as given without copying it, since it is usually
+    a lazy iterator over row tuples that will be consumed only once.
+    """
 
     result: Any
     fields: tuple[str, ...]
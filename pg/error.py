@@ -25,6 +25,7 @@ __all__ = [
 # Error messages
 
 E = TypeVar('E', bound=Error)
+D = TypeVar('D', bound=DatabaseError)
 
 def error(msg: str, cls: type[E]) -> E:
     """Return specified error object with empty sqlstate attribute."""
@@ -34,26 +35,33 @@ def error(msg: str, cls: type[E]) -> E:
     return error
 
 
+def _db_error(msg: str, cls: type[D]) -> D:
+    """Return database error object with empty sqlstate attribute."""
+    err = cls(msg)
+    err.sqlstate = None
+    return err
+
+
 def db_error(msg: str) -> DatabaseError:
     """Return DatabaseError."""
-    return error(msg, DatabaseError)
+    return _db_error(msg, DatabaseError)
 
 
 def int_error(msg: str) -> InternalError:
     """Return InternalError."""
-    return error(msg, InternalError)
+    return _db_error(msg, InternalError)
 
 
 def prg_error(msg: str) -> ProgrammingError:
     """Return ProgrammingError."""
-    return error(msg, ProgrammingError)
+    return _db_error(msg, ProgrammingError)
 
 
 def if_error(msg: str) -> InterfaceError:
     """Return InterfaceError."""
-    return error(msg, InterfaceError)
+    return InterfaceError(msg)  # this is not a DatabaseError
 
 
 def op_error(msg: str) -> OperationalError:
     """Return OperationalError."""
-    return error(msg, OperationalError)
+    return _db_error(msg, OperationalError)
@@ -4,9 +4,17 @@ from __future__ import annotations
 
 from collections import namedtuple
 from decimal import Decimal
-from functools import lru_cache
+from functools import lru_cache, partial
 from json import loads as jsondecode
-from typing import Any, Callable, Generator, NamedTuple, Sequence
+from operator import itemgetter
+from typing import (
+    Any,
+    Callable,
+    Generator,
+    Iterator,
+    NamedTuple,
+    Sequence,
+)
 
 from .core import Query, set_decimal, set_jsondecode, set_query_helpers
 
@@ -15,6 +23,7 @@ SomeNamedTuple = Any  # alias for accessing arbitrary named tuples
 __all__ = [
     'QuoteDict',
     'RowCache',
+    'columniter',
     'dictiter',
     'namediter',
     'namednext',
@@ -26,6 +35,7 @@ __all__ = [
 
 # Small helper functions
 
+@lru_cache(maxsize=256)
 def quote_if_unqualified(param: str, name: int | str) -> str:
     """Quote parameter representing a qualified name.
 
@@ -38,6 +48,7 @@ def quote_if_unqualified(param: str, name: int | str) -> str:
         return f'quote_ident({param})'
     return param
 
+@lru_cache(maxsize=256)
 def oid_key(table: str) -> str:
     """Build oid key from a table name."""
     return f'oid({table})'
@@ -66,12 +77,12 @@ class RowCache:
     @staticmethod
     @lru_cache(maxsize=1024)
     def row_factory(names: Sequence[str]) -> Callable[[Sequence], NamedTuple]:
-        """Get a namedtuple factory for row results with the given names."""
-        try:
-            return namedtuple('Row', names, rename=True)._make  # type: ignore
-        except ValueError:  # there is still a problem with the field names
-            names = [f'column_{n}' for n in range(len(names))]
-            return namedtuple('Row', names)._make  # type: ignore
+        """Get a namedtuple factory for row results with the given names.
+
+        Field names that are not valid identifiers are renamed by their
+        positions, so creating the namedtuple class does not fail.
+        """
+        return namedtuple('Row', names, rename=True)._make  # type: ignore
 
     @classmethod
     def clear(cls) -> None:
@@ -90,11 +101,11 @@ class RowCache:
 
 # Helper functions used by the query object
 
-def dictiter(q: Query) -> Generator[dict[str, Any], None, None]:
+def dictiter(q: Query) -> Iterator[dict[str, Any]]:
     """Get query result as an iterator of dictionaries."""
     fields: tuple[str, ...] = q.listfields()
-    for r in q:
-        yield dict(zip(fields, r))
+    # iterate at the C level without running a Python loop for every row
+    return map(dict, map(partial(zip, fields), q))
 
 
 def namediter(q: Query) -> Generator[SomeNamedTuple, None, None]:
@@ -109,10 +120,29 @@ def namednext(q: Query) -> SomeNamedTuple:
     return RowCache.row_factory(q.listfields())(next(q))
 
 
-def scalariter(q: Query) -> Generator[Any, None, None]:
+def scalariter(q: Query) -> Iterator[Any]:
     """Get query result as an iterator of scalar values."""
-    for r in q:
-        yield r[0]
+    return map(itemgetter(0), q)
+
+
+def columniter(q: Query, *names: str) -> Iterator[tuple]:
+    """Get the given columns of a query result as an iterator of tuples.
+
+    If no column names are given, all columns will be returned.
+    """
+    if not names:
+        return iter(q)
+    fields: tuple[str, ...] = q.listfields()
+    # map the field names to their positions in one pass over the fields
+    field_index = {name: i for i, name in enumerate(fields)}
+    try:
+        index = [field_index[name] for name in names]
+    except KeyError as e:
+        raise KeyError('Missing column in result') from e
+    if len(index) > 1:
+        return map(itemgetter(*index), q)
+    # zip() over one iterable makes tuples with one item
+    return zip(map(itemgetter(index[0]), q))
 
 
 # Initialization
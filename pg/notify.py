@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import select
+import selectors
 from typing import TYPE_CHECKING, Callable
 
 from .core import Query
@@ -64,16 +64,16 @@ class NotificationHandler:
         """Start listening for the event and the stop event."""
         db = self.db
         if db and not self.listening:
-            db.query(f'listen "{self.event}"')
-            db.query(f'listen "{self.stop_event}"')
+            # listen to both events in one round-trip to the server
+            db.query(f'listen "{self.event}"; listen "{self.stop_event}"')
             self.listening = True
 
     def unlisten(self) -> None:
         """Stop listening for the event and the stop event."""
         db = self.db
         if db and self.listening:
-            db.query(f'unlisten "{self.event}"')
-            db.query(f'unlisten "{self.stop_event}"')
+            db.query(
+                f'unlisten "{self.event}"; unlisten "{self.stop_event}"')
             self.listening = False
 
     def notify(self, db: DB | None = None, stop: bool = False,
@@ -119,31 +119,48 @@ class NotificationHandler:
         Note: If you run this loop in another thread, don't use the same
         database connection for database operations in the main thread.
         """
-        if not self.db:
+        db = self.db
+        if not db:
             return
         self.listen()
-        poll = self.timeout == 0
-        rlist = [] if poll else [self.db.fileno()]
+        if self.timeout == 0:  # poll mode
+            self._loop(db, None)
+        else:
+            # use epoll or kqueue where available instead of select
+            with selectors.DefaultSelector() as selector:
+                selector.register(db.fileno(), selectors.EVENT_READ)
+                self._loop(db, selector.select)
+
+    def _loop(self, db: DB, select: Callable | None) -> None:
+        """Run the loop of the notification handler."""
+        # bind everything that is needed in the loop to local variables
+        timeout = self.timeout
+        getnotify = db.getnotify
+        callback = self.callback
+        arg_dict = self.arg_dict
+        event_name, stop_event_name = self.event, self.stop_event
+        # the callback may close the connection or stop listening
         while self.db and self.listening:
-            # noinspection PyUnboundLocalVariable
-            if poll or select.select(rlist, [], [], self.timeout)[0]:
+            if not select or select(timeout):
                 while self.db and self.listening:
-                    notice = self.db.getnotify()
+                    notice = getnotify()
                     if not notice:  # no more messages
                         break
                     event, pid, extra = notice
-                    if event not in (self.event, self.stop_event):
+                    if event != event_name and event != stop_event_name:
                         self.unlisten()
                         raise db_error(
-                            f'Listening for "{self.event}"'
-                            f' and "{self.stop_event}",'
+                            f'Listening for "{event_name}"'
+                            f' and "{stop_event_name}",'
                             f' but notified of "{event}"')
-                    if event == self.stop_event:
+                    if event == stop_event_name:
                         self.unlisten()
-                    self.arg_dict.update(pid=pid, event=event, extra=extra)
-                    self.callback(self.arg_dict)
-                if poll:
+                    arg_dict['pid'] = pid
+                    arg_dict['event'] = event
+                    arg_dict['extra'] = extra
+                    callback(arg_dict)
+                if not select:  # poll mode
                     break
             else:   # we timed out
                 self.unlisten()
-                self.callback(None)
\ No newline at end of file
+                callback(None)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 __all__ = ['timezone_as_offset']
 
 # time zones used in Postgres timestamptz output
@@ -11,11 +13,25 @@ _timezone_offsets: dict[str, str] = {
     'UCT': '+0000', 'UTC': '+0000', 'WET': '+0000'
 }
 
+# offsets in the forms +HH and +HH:MM as used in Postgres timestamptz output,
+# here only the common ones with full quarters of an hour
+_timezone_offsets.update(
+    (f'{sign}{hour:02d}', f'{sign}{hour:02d}00')
+    for sign in '+-' for hour in range(24))
+_timezone_offsets.update(
+    (f'{sign}{hour:02d}:{minute:02d}', f'{sign}{hour:02d}{minute:02d}')
+    for sign in '+-' for hour in range(24) for minute in (0, 15, 30, 45))
+
 
+# The cache can be small since only few different time zones and offsets
+# will usually be found in the output of a database.
+@lru_cache(maxsize=128)
 def timezone_as_offset(tz: str) -> str:
     """Convert timezone abbreviation to offset."""
-    if tz.startswith(('+', '-')):
-        if len(tz) < 5:
-            return tz + '00'
-        return tz.replace(':', '')
-    return _timezone_offsets.get(tz, '+0000')
\ No newline at end of file
+    offset = _timezone_offsets.get(tz)
+    if offset:
+        return offset
+    sign = tz[:1]  # slicing also works with an empty string
+    if sign == '+' or sign == '-':
+        return tz + '00' if len(tz) < 5 else tz.replace(':', '')
+    return '+0000'
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import date, datetime, time, timedelta, tzinfo
+from datetime import date, datetime, time, timedelta
 from json import dumps as jsonencode
 from re import compile as regex
 from time import localtime
@@ -62,18 +62,25 @@ class DbType(frozenset):
     def __eq__(self, other: Any) -> bool:
         """Check whether types are considered equal."""
         if isinstance(other, str):
-            if other.startswith('_'):
-                other = other[1:]
-            return other in self
-        return super().__eq__(other)
+            # array types are considered equal to their element types
+            return other in self or (
+                other[:1] == '_' and other[1:] in self)
+        return other is self or super().__eq__(other)
 
     def __ne__(self, other: Any) -> bool:
         """Check whether types are not considered equal."""
         if isinstance(other, str):
-            if other.startswith('_'):
-                other = other[1:]
-            return other not in self
-        return super().__ne__(other)
+            return other not in self and (
+                other[:1] != '_' or other[1:] not in self)
+        return other is not self and super().__ne__(other)
+
+    def __copy__(self) -> DbType:
+        """Return the type object itself since it is immutable."""
+        return self
+
+    def __deepcopy__(self, memo: dict) -> DbType:
+        """Return the type object itself since it is immutable."""
+        return self
 
 
 class ArrayType:
@@ -85,12 +92,6 @@ class ArrayType:
             return other.startswith('_')
         return isinstance(other, ArrayType)
 
-    def __ne__(self, other: Any) -> bool:
-        """Check whether arrays are different."""
-        if isinstance(other, str):
-            return not other.startswith('_')
-        return not isinstance(other, ArrayType)
-
 
 class RecordType:
     """Type class for PostgreSQL record types."""
@@ -103,14 +104,6 @@ class RecordType:
             return other == 'record'
         return isinstance(other, RecordType)
 
-    def __ne__(self, other: Any) -> bool:
-        """Check whether records are different."""
-        if isinstance(other, TypeCode):
-            return other.type != 'c'
-        if isinstance(other, str):
-            return other != 'record'
-        return not isinstance(other, RecordType)
-
 
 # Mandatory type objects defined by DB-API 2 specs:
 
@@ -150,45 +143,33 @@ RECORD = RecordType()
 
 # Mandatory type helpers defined by DB-API 2 specs:
 
-def Date(year: int, month: int, day: int) -> date:  # noqa: N802
-    """Construct an object holding a date value."""
-    return date(year, month, day)
-
-
-def Time(hour: int, minute: int = 0,  # noqa: N802
-         second: int = 0, microsecond: int = 0,
-         tzinfo: tzinfo | None = None) -> time:
-    """Construct an object holding a time value."""
-    return time(hour, minute, second, microsecond, tzinfo)
-
-
-def Timestamp(year: int, month: int, day: int,  # noqa: N802
-              hour: int = 0, minute: int = 0,
-              second: int = 0, microsecond: int = 0,
-              tzinfo: tzinfo | None = None) -> datetime:
-    """Construct an object holding a time stamp value."""
-    return datetime(year, month, day, hour, minute,
-                    second, microsecond, tzinfo)
+Date = date  # Construct an object holding a date value
+Time = time  # Construct an object holding a time value
+Timestamp = datetime  # Construct an object holding a time stamp value
 
 
 def DateFromTicks(ticks: float | None) -> date:  # noqa: N802
     """Construct an object holding a date value from the given ticks value."""
-    return Date(*localtime(ticks)[:3])
+    t = localtime(ticks)
+    return date(t.tm_year, t.tm_mon, t.tm_mday)
 
 
 def TimeFromTicks(ticks: float | None) -> time:  # noqa: N802
     """Construct an object holding a time value from the given ticks value."""
-    return Time(*localtime(ticks)[3:6])
+    t = localtime(ticks)
+    return time(t.tm_hour, t.tm_min, t.tm_sec)
 
 
 def TimestampFromTicks(ticks: float | None) -> datetime:  # noqa: N802
     """Construct an object holding a time stamp from the given ticks value."""
-    return Timestamp(*localtime(ticks)[:6])
+    return datetime(*localtime(ticks)[:6])
 
 
 class Binary(bytes):
     """Construct an object capable of holding a binary (long) string value."""
 
+    __slots__ = ()
+
 
 # Additional type helpers for PyGreSQL:
 
@@ -9,7 +9,7 @@ from functools import partial
 from inspect import signature
 from json import loads as jsondecode
 from re import compile as regex
-from typing import Any, Callable, ClassVar, Sequence
+from typing import Any, Callable, ClassVar, Iterable, Sequence
 from uuid import UUID as Uuid  # noqa: N811
 
 from pg.core import Connection as Cnx
@@ -83,7 +83,10 @@ def decimal_type(decimal_type: type | None = None) -> type:
 
 def cast_bool(value: str) -> bool | None:
     """Cast boolean value in database format to bool."""
-    return value[0] in ('t', 'T') if value else None
+    return value[0] in 'tT' if value else None
+
+
+_re_not_money = regex(r'[^\d.-]+')
 
 
 def cast_money(value: str) -> _Decimal | None:
@@ -91,7 +94,7 @@ def cast_money(value: str) -> _Decimal | None:
     if not value:
         return None
     value = value.replace('(', '-')
-    return Decimal(''.join(c for c in value if c.isdigit() or c in '.-'))
+    return Decimal(_re_not_money.sub('', value))
 
 
 def cast_int2vector(value: str) -> list[int]:
@@ -522,13 +525,30 @@ class TypeCache(dict):
             res = self._src.fetch(1)
         if not res:
             raise KeyError(f'Type {key} could not be found')
-        r = res[0]
+        return self._add_type(res[0])
+
+    def _add_type(self, r: Sequence) -> TypeCode:
+        """Add the type info from a row of pg_type to the cache."""
         type_code = TypeCode.create(
             int(r[0]), r[1], int(r[2]), r[3], r[4], r[5], int(r[6]))
         # noinspection PyUnresolvedReferences
         self[type_code.oid] = self[str(type_code)] = type_code
         return type_code
 
+    def load(self, oids: Iterable[int]) -> None:
+        """Get the type info for the given OIDs with a single query.
+
+        Only the types that are not already cached will be queried.
+        """
+        oids = {oid for oid in oids if oid not in self}
+        if not oids:
+            return
+        oid_list = ','.join(map(str, oids))
+        self._src.execute(self._query_pg_type.format(
+            f"ANY('{{{oid_list}}}'::pg_catalog.oid[])"))
+        for r in self._src.fetch(-1):
+            self._add_type(r)
+
     def get(self, key: int | str,  # type: ignore
             default: TypeCode | None = None) -> TypeCode | None:
         """Get the type even if it is not cached."""
@@ -586,9 +606,24 @@ class TypeCache(dict):
         typecasts = self._typecasts
         casts = [typecasts[typ] for typ in types]
         casts = [cast if cast is not str else None for cast in casts]
+        # specialize the row caster for the columns that need to be cast
+        cast_columns = [(i, cast) for i, cast in enumerate(casts) if cast]
+        if not cast_columns:
+            return list
+        if len(cast_columns) == len(casts):
+
+            def row_caster(row: Sequence) -> Sequence:
+                return [None if value is None else cast(value)
+                        for cast, value in zip(casts, row)]
+
+        else:
 
-        def row_caster(row: Sequence) -> Sequence:
-            return [value if cast is None or value is None else cast(value)
-                    for cast, value in zip(casts, row)]
+            def row_caster(row: Sequence) -> Sequence:
+                row = list(row)
+                for i, cast in cast_columns:
+                    value = row[i]
+                    if value is not None:
+                        row[i] = cast(value)
+                return row
 
         return row_caster
\ No newline at end of file
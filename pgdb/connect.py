@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from contextlib import suppress
 from typing import Any
 
 from pg.core import connect as get_cnx
@@ -22,16 +23,11 @@ def connect(dsn: str | None = None,
     dbuser: str | None = ""
     dbpasswd: str | None = ""
     dbopt: str | None = ""
-    if dsn:
-        try:
-            params = dsn.split(":", 4)
-            dbhost = params[0]
-            dbname = params[1]
-            dbuser = params[2]
-            dbpasswd = params[3]
-            dbopt = params[4]
-        except (AttributeError, IndexError, TypeError):
-            pass
+    if dsn and isinstance(dsn, str):
+        params = dsn.split(":", 4)
+        if len(params) < 5:  # missing params are empty
+            params.extend([""] * (5 - len(params)))
+        dbhost, dbname, dbuser, dbpasswd, dbopt = params
 
     # override if necessary
     if user is not None:
@@ -40,13 +36,11 @@ def connect(dsn: str | None = None,
         dbpasswd = password
     if database is not None:
         dbname = database
-    if host:
-        try:
-            params = host.split(":", 1)
-            dbhost = params[0]
-            dbport = int(params[1])
-        except (AttributeError, IndexError, TypeError, ValueError):
-            pass
+    if host and isinstance(host, str):
+        dbhost, _sep, port = host.partition(":")
+        if port:
+            with suppress(ValueError):
+                dbport = int(port)
 
     # empty host is localhost
     if dbhost == "":
@@ -49,7 +49,8 @@ class Connection:
         self.cursor_type = Cursor
         self.autocommit = False
         try:
-            self._cnx.source()
+            # source object for transaction control
+            self._src = cnx.source()
         except Exception as e:
             raise op_error("Invalid connection") from e
 
@@ -65,7 +66,7 @@ class Connection:
             if not cnx:
                 raise op_error("Connection has been closed")
             try:
-                cnx.source().execute("BEGIN")
+                self._src.execute("BEGIN")
             except DatabaseError:
                 raise  # database provides error message
             except Exception as e:
@@ -110,7 +111,7 @@ class Connection:
         if self._tnx:
             self._tnx = False
             try:
-                self._cnx.source().execute("COMMIT")
+                self._src.execute("COMMIT")
             except DatabaseError:
                 raise  # database provides error message
             except Exception as e:
@@ -123,7 +124,7 @@ class Connection:
         if self._tnx:
             self._tnx = False
             try:
-                self._cnx.source().execute("ROLLBACK")
+                self._src.execute("ROLLBACK")
             except DatabaseError:
                 raise  # database provides error message
             except Exception as e:
@@ -4,14 +4,27 @@ from __future__ import annotations
 
 from collections import namedtuple
 from collections.abc import Iterable
+from contextlib import suppress
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal
+from itertools import islice
 from math import isinf, isnan
-from typing import TYPE_CHECKING, Any, Callable, Generator, Mapping, Sequence
+from re import compile as regex
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Generator,
+    Iterator,
+    Mapping,
+    Sequence,
+)
 from uuid import UUID as Uuid  # noqa: N811
 
 from pg.core import (
     RESULT_DQL,
+    TRANS_INERROR,
+    TRANS_INTRANS,
     DatabaseError,
     Error,
     InterfaceError,
@@ -30,6 +43,130 @@ if TYPE_CHECKING:
 
 __all__ = ['Cursor', 'CursorDescription']
 
+# simple insert operations with one row of placeholders as values,
+# which can be executed for many rows with a single multi-row insert
+_re_insert_values = regex(
+    r'(?is)(\s*insert\s+into\s.+\svalues\s*)'
+    r'(\(\s*%(?:\(\w+\))?s(?:\s*,\s*%(?:\(\w+\))?s)*\s*\))\s*;?\s*$')
+
+
+_re_param_names = regex(r'%%|%\(([^)]*)\)')
+
+
+def _param_names(operation: str) -> set[str]:
+    """Get the names of the parameters used in the given operation."""
+    return {name for name in _re_param_names.findall(operation) if name}
+
+
+# Quoting of parameters, with functions for the types that can be quoted
+
+QuoteFunc = Callable[['Cursor', Any], Any]
+
+
+def _quote_null(cursor: Cursor, value: None) -> str:
+    return 'NULL'
+
+
+def _quote_plain(cursor: Cursor, value: Any) -> Any:
+    return value
+
+
+def _quote_str(cursor: Cursor, value: str) -> str:
+    return f"'{cursor._cnx.escape_string(value)}'"
+
+
+def _quote_bytes(cursor: Cursor, value: bytes) -> str:
+    return f"'{cursor._cnx.escape_string(value).decode()}'"
+
+
+def _quote_binary(cursor: Cursor,
+                  value: Binary | bytearray | memoryview) -> str:
+    return f"'{cursor._cnx.escape_bytea(value).decode('ascii')}'"
+
+
+def _quote_as_str(cursor: Cursor, value: Hstore | Json) -> str:
+    return f"'{cursor._cnx.escape_string(str(value))}'"
+
+
+def _quote_float(cursor: Cursor, value: float) -> float | str:
+    if isinf(value):
+        return "'-Infinity'" if value < 0 else "'Infinity'"
+    if isnan(value):
+        return "'NaN'"
+    return value
+
+
+def _quote_datetime(cursor: Cursor, value: datetime) -> str:
+    if value.tzinfo:
+        return f"'{value}'::timestamptz"
+    return f"'{value}'::timestamp"
+
+
+def _quote_date(cursor: Cursor, value: date) -> str:
+    return f"'{value}'::date"
+
+
+def _quote_time(cursor: Cursor, value: time) -> str:
+    if value.tzinfo:
+        return f"'{value}'::timetz"
+    return f"'{value}'::time"
+
+
+def _quote_timedelta(cursor: Cursor, value: timedelta) -> str:
+    return f"'{value}'::interval"
+
+
+def _quote_uuid(cursor: Cursor, value: Uuid) -> str:
+    return f"'{value}'::uuid"
+
+
+def _quote_list(cursor: Cursor, value: list) -> str:
+    # Quote value as an ARRAY constructor. This is better than using
+    # an array literal because it carries the information that this is
+    # an array and not a string.  One issue with this syntax is that
+    # you need to add an explicit typecast when passing empty arrays.
+    # The ARRAY keyword is actually only necessary at the top level.
+    if not value:  # exception for empty array
+        return "'{}'"
+    v = ','.join(map(str, map(cursor._quote, value)))
+    return f'ARRAY[{v}]'
+
+
+def _quote_tuple(cursor: Cursor, value: tuple) -> str:
+    # Quote as a ROW constructor.  This is better than using a record
+    # literal because it carries the information that this is a record
+    # and not a string.  We don't use the keyword ROW in order to make
+    # this usable with the IN syntax as well.  It is only necessary
+    # when the records has a single column which is not really useful.
+    v = ','.join(map(str, map(cursor._quote, value)))
+    return f'({v})'
+
+
+# the quote functions for the base types, in the order they must be checked
+_quote_base_funcs: list[tuple[type | tuple[type, ...], QuoteFunc]] = [
+    (type(None), _quote_null),
+    ((Hstore, Json), _quote_as_str),
+    ((Binary, bytearray, memoryview), _quote_binary),
+    (str, _quote_str),
+    (bytes, _quote_bytes),
+    (float, _quote_float),
+    ((int, Decimal, Literal), _quote_plain),
+    (datetime, _quote_datetime),
+    (date, _quote_date),
+    (time, _quote_time),
+    (timedelta, _quote_timedelta),
+    (Uuid, _quote_uuid),
+    (list, _quote_list),
+    (tuple, _quote_tuple)]
+
+
+def _get_quote_func(typ: type) -> QuoteFunc | None:
+    """Get the function for quoting values of the given type."""
+    for base, quote in _quote_base_funcs:
+        if issubclass(typ, base):
+            return quote
+    return None
+
 
 class Cursor:
     """Cursor object."""
@@ -43,15 +180,23 @@ class Cursor:
         self._cnx: Cnx = cnx
         self.type_cache: TypeCache = connection.type_cache
         self._src = self._cnx.source()
+        # the quote functions for all types found so far, by exact type
+        self._quote_funcs: dict[type, QuoteFunc] = {}
         # the official attribute for describing the result columns
         self._description: list[CursorDescription] | bool | None = None
+        # the function for casting the rows of the current result set
+        self._row_caster: Callable[[Sequence], Sequence] | None = None
         if self.row_factory is Cursor.row_factory:
             # the row factory needs to be determined dynamically
             self.row_factory = None  # type: ignore
         else:
             self.build_row_factory = None  # type: ignore
+        # whether the rows are returned as named tuples
+        self._named_rows = False
         self.rowcount: int | None = -1
         self.arraysize: int = 1
+        self.page_size: int = 128
+        self.copy_size: int = 65536
         self.lastrowid: int | None = None
 
     def __iter__(self) -> Cursor:
@@ -69,59 +214,18 @@ class Cursor:
 
     def _quote(self, value: Any) -> Any:
         """Quote value depending on its type."""
-        if value is None:
-            return 'NULL'
-        if isinstance(value, (Hstore, Json)):
-            value = str(value)
-        if isinstance(value, (bytes, str)):
-            cnx = self._cnx
-            if isinstance(value, Binary):
-                value = cnx.escape_bytea(value).decode('ascii')
-            else:
-                value = cnx.escape_string(value)
-            return f"'{value}'"
-        if isinstance(value, float):
-            if isinf(value):
-                return "'-Infinity'" if value < 0 else "'Infinity'"
-            if isnan(value):
-                return "'NaN'"
-            return value
-        if isinstance(value, (int, Decimal, Literal)):
-            return value
-        if isinstance(value, datetime):
-            if value.tzinfo:
-                return f"'{value}'::timestamptz"
-            return f"'{value}'::timestamp"
-        if isinstance(value, date):
-            return f"'{value}'::date"
-        if isinstance(value, time):
-            if value.tzinfo:
-                return f"'{value}'::timetz"
-            return f"'{value}'::time"
-        if isinstance(value, timedelta):
-            return f"'{value}'::interval"
-        if isinstance(value, Uuid):
-            return f"'{value}'::uuid"
-        if isinstance(value, list):
-            # Quote value as an ARRAY constructor. This is better than using
-            # an array literal because it carries the information that this is
-            # an array and not a string.  One issue with this syntax is that
-            # you need to add an explicit typecast when passing empty arrays.
-            # The ARRAY keyword is actually only necessary at the top level.
-            if not value:  # exception for empty array
-                return "'{}'"
-            q = self._quote
-            v = ','.join(str(q(v)) for v in value)
-            return f'ARRAY[{v}]'
-        if isinstance(value, tuple):
-            # Quote as a ROW constructor.  This is better than using a record
-            # literal because it carries the information that this is a record
-            # and not a string.  We don't use the keyword ROW in order to make
-            # this usable with the IN syntax as well.  It is only necessary
-            # when the records has a single column which is not really useful.
-            q = self._quote
-            v = ','.join(str(q(v)) for v in value)
-            return f'({v})'
+        typ = type(value)
+        try:
+            quote = self._quote_funcs[typ]
+        except KeyError:
+            found = _get_quote_func(typ)
+            if found is None:
+                return self._quote_other(value)
+            quote = self._quote_funcs[typ] = found
+        return quote(self, value)
+
+    def _quote_other(self, value: Any) -> Any:
+        """Quote value of a type with a custom __pg_repr__ method."""
         try:  # noinspection PyUnresolvedReferences
             value = value.__pg_repr__()
         except AttributeError as e:
@@ -132,26 +236,83 @@ class Cursor:
         return value
 
     def _quoteparams(self, string: str,
-                     parameters: Mapping | Sequence | None) -> str:
+                     parameters: Mapping | Sequence | None,
+                     names: Iterable[str] | None = None) -> str:
         """Quote parameters.
 
         This function works for both mappings and sequences.
 
         The function should be used even when there are no parameters,
         so that we have a consistent behavior regarding percent signs.
+
+        If the names of the parameters used in the string are passed,
+        only these are quoted for mappings, otherwise they are quoted
+        when they are requested by the string.
         """
         if not parameters:
+            if '%' not in string:
+                return string  # nothing to substitute or unescape
             try:
                 return string % ()  # unescape literal quotes if possible
             except (TypeError, ValueError):
                 return string  # silently accept unescaped quotes
         if isinstance(parameters, dict):
-            parameters = QuoteDict(parameters)
-            parameters.quote = self._quote
+            if names is None:
+                parameters = QuoteDict(parameters)
+                parameters.quote = self._quote
+            else:
+                quote = self._quote
+                parameters = {name: quote(parameters[name]) for name in names}
         else:
             parameters = tuple(map(self._quote, parameters))
         return string % parameters
 
+    def _operations(self, operation: str,
+                    seq_of_parameters: Sequence[Sequence | None]
+                    ) -> Iterator[str]:
+        """Generate the commands for executing an operation many times.
+
+        Simple inserts of one row are combined to multi-row inserts
+        with up to page_size rows, everything else is executed row by row.
+        Note that each multi-row insert is atomic, so in autocommit mode,
+        a failing row prevents all rows of its page from being inserted.
+        """
+        quote = self._quoteparams
+        match = _re_insert_values.match(operation)
+        if match:
+            page_size = self.page_size
+            if page_size > 1:
+                prefix, values = match.groups()
+                prefix = quote(prefix, None)
+                names = _param_names(values)
+                rows = iter(seq_of_parameters)
+                page = list(islice(rows, page_size))
+                while page:
+                    yield prefix + ','.join(
+                        quote(values, p, names) for p in page)
+                    page = list(islice(rows, page_size))
+                return
+        # find the names of the parameters only once for all rows
+        names = _param_names(operation)
+        for parameters in seq_of_parameters:
+            yield quote(operation, parameters, names)
+
+    def _batches(self, operation: str,
+                 seq_of_parameters: Sequence[Sequence | None],
+                 page_size: int) -> Iterator[str]:
+        """Generate batches of commands for executing an operation.
+
+        The commands for up to page_size parameter sets are joined
+        so that they can be sent to the database in one round-trip.
+        """
+        quote = self._quoteparams
+        names = _param_names(operation)
+        parameters = iter(seq_of_parameters)
+        page = list(islice(parameters, page_size))
+        while page:
+            yield ';'.join(quote(operation, p, names) for p in page)
+            page = list(islice(parameters, page_size))
+
     def _make_description(self, info: tuple[int, str, int, int, int]
                           ) -> CursorDescription:
         """Make the description tuple for the given field info."""
@@ -181,7 +342,10 @@ class Cursor:
             return None
         if not isinstance(description, list):
             make = self._make_description
-            description = [make(info) for info in self._src.listinfo()]
+            info = self._src.listinfo()
+            # look up all unknown types of the columns at once
+            self.type_cache.load(i[2] for i in info)
+            description = [make(i) for i in info]
             self._description = description
         return description
 
@@ -222,29 +386,83 @@ class Cursor:
         if not seq_of_parameters:
             # don't do anything without parameters
             return self
+        return self._execute(
+            operation, self._operations(operation, seq_of_parameters))
+
+    def execute_batch(self, operation: str,
+                      seq_of_parameters: Sequence[Sequence | None],
+                      page_size: int | None = None) -> Cursor:
+        """Execute operation against a parameter sequence in batches.
+
+        The commands for up to page_size parameter sets are sent to the
+        database in one round-trip.  If page_size is not given, the
+        cursor's page_size is used.  Since only the number of rows
+        affected by the last command of a batch is reported, the
+        rowcount will always be -1 after a batch of DML commands.
+        """
+        if page_size is None:
+            page_size = self.page_size
+        elif not isinstance(page_size, int):
+            raise TypeError("The page size must be an integer")
+        if page_size < 1:
+            raise ValueError("The page size must be positive")
+        if not seq_of_parameters:
+            # don't do anything without parameters
+            return self
+        self._execute(operation, self._batches(
+            operation, seq_of_parameters, page_size))
+        if not self._description:
+            # the row counts of the batches are not known
+            self.rowcount = -1
+        return self
+
+    def _execute(self, operation: str, commands: Iterable[str]) -> Cursor:
+        """Execute the given commands generated from the operation."""
         self._description = None
+        self._row_caster = None
         self.rowcount = -1
         # first try to execute all queries
         rowcount = 0
-        sql = "BEGIN"
+        connection = self._connection
+        begin = not connection._tnx and not connection.autocommit
+        execute = self._src.execute
+        sql = operation
         try:
-            if not self._connection._tnx and not self._connection.autocommit:
+            if begin and operation.lstrip()[:4].lower() == 'copy':
+                # copy commands must be sent on their own
                 try:
-                    self._src.execute(sql)
+                    execute("BEGIN")
                 except DatabaseError:
                     raise  # database provides error message
                 except Exception as e:
                     raise op_error("Can't start transaction") from e
                 else:
-                    self._connection._tnx = True
-            for parameters in seq_of_parameters:
-                sql = operation
-                sql = self._quoteparams(sql, parameters)
-                rows = self._src.execute(sql)
+                    connection._tnx = True
+                    begin = False
+            for sql in commands:
+                if begin:
+                    # start the transaction in the same round-trip
+                    # as the first command
+                    try:
+                        rows = execute(f'BEGIN;{sql}')
+                    except BaseException:
+                        # the transaction may have been started
+                        # even though the command failed
+                        with suppress(Exception):
+                            connection._tnx = self._cnx.transaction() in (
+                                TRANS_INERROR, TRANS_INTRANS)
+                        raise
+                    connection._tnx = True
+                    begin = False
+                else:
+                    rows = execute(sql)
                 if rows:  # true if not DML
                     rowcount += rows
                 else:
                     self.rowcount = -1
+                # the next command is built lazily and building it may
+                # fail, in which case the operation should be reported
+                sql = operation
         except DatabaseError:
             raise  # database provides error message
         except Error as err:
@@ -260,6 +478,11 @@ class Cursor:
             build_row_factory = self.build_row_factory
             if build_row_factory:  # type: ignore
                 self.row_factory = build_row_factory()  # type: ignore
+                # the default builder creates named tuples, other
+                # row factories may expect to get lists they can change
+                self._named_rows = getattr(
+                    build_row_factory, '__func__', None
+                    ) is Cursor.build_row_factory
         else:
             self.rowcount = rowcount
             self.lastrowid = self._src.oidstatus()
@@ -299,18 +522,26 @@ class Cursor:
         except Error as err:
             raise db_error(str(err)) from err
         row_factory = self.row_factory
-        coltypes = self.coltypes
-        if coltypes is None:
-            # cannot determine column types, return raw result
-            return [row_factory(row) for row in result]
-        if len(result) > 5:
-            # optimize the case where we really fetch many values
-            # by looking up all type casting functions upfront
+        cast_row: Callable[[Sequence], Sequence] | None = self._row_caster
+        if cast_row is None:
+            coltypes = self.coltypes
+            if coltypes is None:
+                # cannot determine column types, return raw result
+                if row_factory is not None:
+                    return list(map(row_factory, result))
+                return list(map(list, result))
+            # look up all type casting functions only once per result set
             cast_row = self.type_cache.get_row_caster(coltypes)
-            return [row_factory(cast_row(row)) for row in result]
-        cast_value = self.type_cache.typecast
-        return [row_factory([cast_value(value, typ)
-                for typ, value in zip(coltypes, row)]) for row in result]
+            if (cast_row is list and row_factory is not None
+                    and self._named_rows):
+                # named tuples can be made from the fetched tuples directly
+                # (calling tuple() on a tuple does not create a copy)
+                cast_row = tuple
+            self._row_caster = cast_row
+        rows = map(cast_row, result)
+        if row_factory is not None:
+            rows = map(row_factory, rows)
+        return list(rows)
 
     def callproc(self, procname: str, parameters: Sequence | None = None
                  ) -> Sequence | None:
@@ -346,7 +577,7 @@ class Cursor:
         The null option sets the textual representation of NULL in the input.
 
         The size option sets the size of the buffer used when reading data
-        from file-like objects.
+        from file-like objects.  It defaults to the cursor's copy_size.
 
         The copy operation can be restricted to a subset of columns. If no
         columns are specified, all of them will be copied.
@@ -370,16 +601,21 @@ class Cursor:
             if isinstance(stream, (bytes, str)):
                 if not isinstance(stream, input_type):
                     raise ValueError(f"The input must be {type_name}") from e
+                # send a missing final newline separately
+                # instead of copying the whole input
+                newline: bytes | str | None = None
                 if not binary_format:
                     if isinstance(stream, str):
                         if not stream.endswith('\n'):
-                            stream += '\n'
+                            newline = '\n'
                     else:
                         if not stream.endswith(b'\n'):
-                            stream += b'\n'
+                            newline = b'\n'
 
                 def chunks() -> Generator:
                     yield stream
+                    if newline:
+                        yield newline
 
             elif isinstance(stream, Iterable):
 
@@ -388,19 +624,21 @@ class Cursor:
                         if not isinstance(chunk, input_type):
                             raise ValueError(
                                 f"Input stream must consist of {type_name}")
+                        yield chunk
+                        # send a missing newline separately
+                        # instead of copying the chunk
                         if isinstance(chunk, str):
                             if not chunk.endswith('\n'):
-                                chunk += '\n'
+                                yield '\n'
                         else:
                             if not chunk.endswith(b'\n'):
-                                chunk += b'\n'
-                        yield chunk
+                                yield b'\n'
 
             else:
                 raise TypeError("Need an input stream to copy from") from e
         else:
             if size is None:
-                size = 8192
+                size = self.copy_size
             elif not isinstance(size, int):
                 raise TypeError("The size option must be an integer")
             if size > 0:
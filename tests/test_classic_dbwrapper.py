@@ -94,7 +94,7 @@ class TestDBClassBasic(unittest.TestCase):
         attributes = [
             'abort', 'adapter',
             'backend_pid', 'begin',
-            'cancel', 'clear', 'close', 'commit',
+            'cancel', 'chunked', 'clear', 'close', 'columns', 'commit',
             'date_format', 'db', 'dbname', 'dbtypes',
             'debug', 'decode_json', 'delete',
             'delete_prepared', 'describe_prepared',
@@ -112,17 +112,17 @@ class TestDBClassBasic(unittest.TestCase):
             'locreate', 'loimport',
             'notification_handler',
             'options',
-            'parameter', 'pkey', 'pkeys', 'poll', 'port',
+            'parameter', 'pipeline', 'pkey', 'pkeys', 'poll', 'port',
             'prepare', 'protocol_version', 'putline',
             'query', 'query_formatted', 'query_prepared',
             'release', 'reopen', 'reset', 'rollback',
-            'savepoint', 'send_query', 'server_version',
+            'safe_operator', 'savepoint', 'send_query', 'server_version',
             'set_cast_hook', 'set_non_blocking', 'set_notice_receiver',
             'set_parameter', 'socket', 'source',
             'ssl_attributes', 'ssl_in_use',
             'start', 'status',
             'transaction', 'truncate',
-            'unescape_bytea', 'update', 'upsert',
+            'unescape_bytea', 'update', 'update_many', 'upsert',
             'use_regtypes', 'user',
         ]
         db_attributes = [a for a in self.db.__dir__() if not a.startswith('_')]
@@ -1516,6 +1516,44 @@ class TestDBClass(unittest.TestCase):
         s.pop('n')
         self.assertRaises(KeyError, get, table, s)
 
+    def test_get_with_braces_in_column_names(self):
+        get = self.db.get
+        table = 'get_braces_test_table'
+        self.create_table(table, '"{n}" integer primary key, "t}" text',
+                         values=enumerate('xyz', start=1))
+        r = get(table, 2)
+        self.assertEqual(r, {'{n}': 2, 't}': 'y'})
+        r = get(table, 'z', 't}')
+        self.assertEqual(r, {'{n}': 3, 't}': 'z'})
+        r = get(table, (1, 'x'), ('{n}', 't}'))
+        self.assertEqual(r, {'{n}': 1, 't}': 'x'})
+
+    def test_get_without_safe_operator(self):
+        db = self.db
+        get = db.get
+        table = 'get_unsafe_test_table'
+        self.create_table(table, 'n integer primary key, t text',
+                         values=enumerate('xyz', start=1))
+        self.assertIs(db.safe_operator, True)
+        db.safe_operator = False
+        self.addCleanup(setattr, db, 'safe_operator', True)
+        self.assertIs(db.safe_operator, False)
+        r = get(table, 2)
+        self.assertEqual(r, dict(n=2, t='y'))
+        r = get(table, 'z', 't')
+        self.assertEqual(r, dict(n=3, t='z'))
+        try:
+            get(table, 4)
+        except pg.DatabaseError as error:
+            self.assertEqual(
+                str(error),
+                f'No such record in {table}\nwhere "n" = $1\nwith $1=4')
+        else:
+            self.fail('DatabaseError not raised')
+        db.safe_operator = True
+        r = get(table, 1)
+        self.assertEqual(r, dict(n=1, t='x'))
+
     def test_get_with_oids(self):
         if not self.supports_oids:
             self.skipTest("database does not support tables with oids")
@@ -2107,6 +2145,27 @@ class TestDBClass(unittest.TestCase):
             j += 1
         self.assertEqual(r, {'a': 1, 'd': d, 'i': i, 'j': j})
 
+    def test_update_many(self):
+        update_many = self.db.update_many
+        query = self.db.query
+        table = 'update_many_test_table'
+        self.create_table(table, 'n integer primary key, c char(3), m text',
+                         values=[(1, 'a', 'x'), (2, 'b', 'y'), (3, 'c', 'z')])
+        self.assertRaises(KeyError, update_many, table, [dict(c='d')])
+        self.assertEqual(update_many(table, []), 0)
+        self.assertEqual(update_many(table, [dict(n=1)]), 0)
+        rows = [dict(n=1, c='abc'), dict(n=2, c='d', m=None),
+                dict(n=3, m='w'), dict(n=4, c='e')]
+        self.assertEqual(update_many(table, rows), 3)
+        self.assertEqual(rows[0], dict(n=1, c='abc'))
+        r = query(f'select * from "{table}" order by n').getresult()
+        self.assertEqual(
+            r, [(1, 'abc', 'x'), (2, 'd  ', None), (3, 'c  ', 'w')])
+        self.create_table('test_table_without_pkey', 'n integer, t text')
+        self.assertRaises(
+            pg.ProgrammingError, update_many,
+            'test_table_without_pkey', [dict(n=1, t='a')])
+
     def test_upsert(self):
         upsert = self.db.upsert
         query = self.db.query
@@ -2378,6 +2437,41 @@ class TestDBClass(unittest.TestCase):
         r = get(table, d)
         self.assertEqual(r, {'a': 1, 'd': d, 'i': i, 'j': j})
 
+    def test_pipeline(self):
+        db = self.db
+        table = 'pipeline_test_table'
+        self.create_table(table, 'n integer primary key, t text')
+        rows = [dict(n=n, t=t) for n, t in enumerate(["x", "y", "z'"], 1)]
+        with db.pipeline() as p:
+            self.assertIs(p, db)
+            self.assertRaises(pg.InternalError, db.pipeline().__enter__)
+            for row in rows:
+                r = db.insert(table, row)
+                self.assertIs(r, row)
+            r = db.update(table, n=2, t='$1')
+            self.assertEqual(r, dict(n=2, t='$1'))
+            r = db.upsert(table, dict(n=4, t=None))
+            self.assertEqual(r, dict(n=4, t=None))
+            self.assertEqual(db.query(
+                f'select count(*) from "{table}"').singlescalar(), 0)
+        self.assertEqual(rows, [
+            dict(n=1, t='x'), dict(n=2, t='y'), dict(n=3, t="z'")])
+        q = db.query(f'select n, t from "{table}" order by n')
+        self.assertEqual(q.getresult(), [
+            (1, 'x'), (2, '$1'), (3, "z'"), (4, None)])
+        with self.assertRaises(ZeroDivisionError), db.pipeline():
+            db.insert(table, n=5, t='w')
+            1 / 0  # noqa: B018
+        self.assertEqual(db.query(
+            f'select count(*) from "{table}"').singlescalar(), 4)
+        with self.assertRaises(pg.IntegrityError), db.pipeline():
+            db.insert(table, n=6, t='v')
+            db.insert(table, n=1, t='u')
+        self.assertEqual(db.query(
+            f'select count(*) from "{table}"').singlescalar(), 4)
+        with db.pipeline():
+            pass
+
     def test_clear(self):
         clear = self.db.clear
         f = False if pg.get_bool() else 'f'
@@ -3103,6 +3197,33 @@ class TestDBClass(unittest.TestCase):
         r = get_as_dict(table, keyname='id')
         self.assertEqual(r, expected)
 
+    def test_chunked(self):
+        chunked = self.db.chunked
+        q = self.db.query('select generate_series(1, 10)')
+        self.assertRaises(ValueError, chunked, q, 0)
+        r = list(chunked(q, 4))
+        self.assertEqual(r, [
+            [(1,), (2,), (3,), (4,)], [(5,), (6,), (7,), (8,)], [(9,), (10,)]])
+        r = list(chunked(q, 10))
+        self.assertEqual(r, [[(i,) for i in range(1, 11)]])
+        r = list(chunked(q))
+        self.assertEqual(r, [[(i,) for i in range(1, 11)]])
+        q = self.db.query('select 1 where false')
+        self.assertEqual(list(chunked(q, 4)), [])
+
+    def test_columns(self):
+        columns = self.db.columns
+        q = self.db.query("select 1 as a, 'b' as b, 3.0 as c"
+                          " union select 2, 'c', 4.0 order by 1")
+        r = list(columns(q, 'c', 'a'))
+        self.assertEqual(r, [(3.0, 1), (4.0, 2)])
+        self.assertIsInstance(r[0], tuple)
+        r = list(columns(q, 'b'))
+        self.assertEqual(r, [('b',), ('c',)])
+        r = list(columns(q))
+        self.assertEqual(r, [(1, 'b', 3.0), (2, 'c', 4.0)])
+        self.assertRaises(KeyError, columns, q, 'a', 'd')
+
     def test_transaction(self):
         query = self.db.query
         self.create_table('test_table', 'n integer', temporary=False)
@@ -866,6 +866,37 @@ class TestCastInterval(unittest.TestCase):
                 self.assertEqual(cast_interval(value), interval)
 
 
+class TestTimezoneAsOffset(unittest.TestCase):
+    """Test the conversion of time zones to offsets."""
+
+    def test_offsets(self):
+        from pg.tz import timezone_as_offset
+        for tz, offset in [
+                ('+00', '+0000'), ('+01', '+0100'), ('-05', '-0500'),
+                ('+05:30', '+0530'), ('-09:30', '-0930'),
+                ('+0530', '+0530'), ('-1000', '-1000'),
+                ('+23', '+2300'), ('-23:45', '-2345'), ('+05:07', '+0507'),
+                ('+99', '+9900'), ('-99:99', '-9999')]:
+            self.assertEqual(timezone_as_offset(tz), offset)
+
+    def test_abbreviations(self):
+        from pg.tz import timezone_as_offset
+        for tz, offset in [
+                ('UTC', '+0000'), ('CET', '+0100'), ('EST', '-0500'),
+                ('HST', '-1000'), ('XYZ', '+0000'), ('', '+0000')]:
+            self.assertEqual(timezone_as_offset(tz), offset)
+
+    def test_cache(self):
+        from pg.tz import timezone_as_offset
+        timezone_as_offset.cache_clear()
+        self.assertEqual(timezone_as_offset('+02'), '+0200')
+        self.assertEqual(timezone_as_offset('+02'), '+0200')
+        info = timezone_as_offset.cache_info()
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.maxsize, 128)
+
+
 class TestEscapeFunctions(unittest.TestCase):
     """Test pg escape and unescape functions.
 
@@ -899,6 +930,13 @@ class TestEscapeFunctions(unittest.TestCase):
         s = f("that's cheese")
         self.assertIsInstance(s, str)
         self.assertEqual(s, "that''s cheese")
+        b = f(bytearray(b"that's cheese"))
+        self.assertIsInstance(b, bytes)
+        self.assertEqual(b, b"that''s cheese")
+        b = f(memoryview(b"cheese: that's it")[8:])
+        self.assertIsInstance(b, bytes)
+        self.assertEqual(b, b"that''s it")
+        self.assertRaises(TypeError, f, 42)
 
     def test_unescape_bytea(self):
         f = pg.unescape_bytea
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import gc
+import pickle
 import unittest
+from copy import copy, deepcopy
 from datetime import date, datetime, time, timedelta, timezone
 from decimal import Decimal
 from typing import Any, ClassVar
@@ -378,6 +380,25 @@ class TestPgDb(dbapi20.DatabaseAPI20Test):
         finally:
             con.close()
 
+    def test_type_cache_load(self):
+        con = self._connect()
+        try:
+            cur = con.cursor()
+            type_cache = con.type_cache
+            self.assertNotIn(1700, type_cache)
+            self.assertNotIn(1186, type_cache)
+            type_cache.load([1700, 1186, 1700])
+            self.assertIn(1700, type_cache)
+            self.assertIn('numeric', type_cache)
+            self.assertEqual(type_cache[1700], 'numeric')
+            self.assertIn(1186, type_cache)
+            self.assertEqual(type_cache['interval'].oid, 1186)
+            cur.execute("select 1::numeric, '1 hour'::interval, 'x'::text")
+            self.assertEqual(cur.coltypes, ['numeric', 'interval', 'text'])
+            self.assertIn('text', type_cache)
+        finally:
+            con.close()
+
     def test_type_cache_typecast(self):
         con = self._connect()
         try:
@@ -530,6 +551,82 @@ class TestPgDb(dbapi20.DatabaseAPI20Test):
         finally:
             con.close()
 
+    def test_executemany_insert_in_pages(self):
+        table = self.table_prefix + 'booze'
+        con = self._connect()
+        try:
+            cur = con.cursor()
+            cur.execute(f"create table {table} (i int, t text)")
+            self.assertEqual(cur.page_size, 128)
+            cur.page_size = 3
+            params = [(i, f'{i}%') for i in range(10)]
+            cur.executemany(f"insert into {table} values (%s, %s)", params)
+            self.assertEqual(cur.rowcount, 10)
+            dict_params = [dict(i=i, t=None) for i in range(10, 15)]
+            cur.executemany(
+                f"insert into {table} (t, i) values (%(t)s, %(i)s)",
+                iter(dict_params))
+            self.assertEqual(cur.rowcount, 5)
+            cur.execute(f"select i, t from {table} order by 1")
+            rows = cur.fetchall()
+            self.assertEqual(len(rows), 15)
+            self.assertEqual(rows[:10], [(i, f'{i}%') for i in range(10)])
+            self.assertEqual(rows[10:], [(i, None) for i in range(10, 15)])
+        finally:
+            con.close()
+
+    def test_executemany_with_invalid_parameters(self):
+        table = self.table_prefix + 'booze'
+        con = self._connect()
+        try:
+            cur = con.cursor()
+            cur.execute(f"create table {table} (i int, t text)")
+            operation = f"update {table} set t=%s where i=%s"
+            with self.assertRaises(pgdb.InterfaceError) as cm:
+                cur.executemany(operation, [('a', 1), (object(), 2)])
+            self.assertIn(f"Error in '{operation}'", str(cm.exception))
+        finally:
+            con.close()
+
+    def test_execute_batch(self):
+        table = self.table_prefix + 'booze'
+        con = self._connect()
+        try:
+            cur = con.cursor()
+            cur.execute(f"create table {table} (i int, t text)")
+            params = [(i, f'{i}%') for i in range(10)]
+            cur.execute_batch(
+                f"insert into {table} values (%s, %s)", params, 4)
+            self.assertEqual(cur.rowcount, -1)
+            dict_params = [dict(i=i, t=f'{i}!') for i in range(0, 10, 2)]
+            cur.execute_batch(
+                f"update {table} set t=%(t)s where i=%(i)s",
+                iter(dict_params))
+            self.assertEqual(cur.rowcount, -1)
+            self.assertRaises(ValueError, cur.execute_batch,
+                              f"delete from {table}", [()], 0)
+            cur.execute(f"select i, t from {table} order by 1")
+            rows = cur.fetchall()
+            self.assertEqual(rows, [
+                (i, f'{i}!' if i % 2 == 0 else f'{i}%') for i in range(10)])
+        finally:
+            con.close()
+
+    def test_execute_batch_with_invalid_parameters(self):
+        table = self.table_prefix + 'booze'
+        con = self._connect()
+        try:
+            cur = con.cursor()
+            cur.execute(f"create table {table} (i int, t text)")
+            operation = f"update {table} set t=%(t)s where i=%(i)s"
+            with self.assertRaises(pgdb.OperationalError) as cm:
+                cur.execute_batch(
+                    operation, [dict(i=1, t='a'), dict(i=2)], 1)
+            self.assertIn(
+                f"Internal error in '{operation}'", str(cm.exception))
+        finally:
+            con.close()
+
     def test_sqlstate(self):
         con = self._connect()
         cur = con.cursor()
@@ -718,6 +815,20 @@ class TestPgDb(dbapi20.DatabaseAPI20Test):
         self.assertIsInstance(result, Uuid)
         self.assertEqual(result, d)
 
+    def test_binary_buffers(self):
+        data = b'\x00\xff\x52\xb2'
+        con = self._connect()
+        try:
+            cur = con.cursor()
+            for value in (pgdb.Binary(data), bytearray(data),
+                          memoryview(data), memoryview(bytearray(data))):
+                cur.execute("select %s::bytea", (value,))
+                result = cur.fetchone()[0]
+                self.assertIsInstance(result, bytes)
+                self.assertEqual(result, data)
+        finally:
+            con.close()
+
     def test_insert_array(self):
         values: list[tuple[Any, Any]] = [
             (None, None), ([], []), ([None], [[None], ['null']]),
@@ -1343,6 +1454,12 @@ class TestPgDb(dbapi20.DatabaseAPI20Test):
         self.assertEqual('record', pgdb.RECORD)
         self.assertNotEqual('_record', pgdb.RECORD)
 
+    def test_pgdb_type_copy(self):
+        for typ in (pgdb.STRING, pgdb.NUMBER, pgdb.DATETIME):
+            self.assertIs(copy(typ), typ)
+            self.assertIs(deepcopy(typ), typ)
+            self.assertEqual(pickle.loads(pickle.dumps(typ)), typ)
+
     def test_no_close(self):
         data = ('hello', 'world')
         con = self._connect()
@@ -1352,6 +1469,39 @@ class TestPgDb(dbapi20.DatabaseAPI20Test):
         row = cur.fetchone()
         self.assertEqual(row, data)
 
+    def test_no_row_factory(self):
+        con = self._connect()
+        cur = con.cursor()
+        cur.build_row_factory = lambda: None
+        cur.execute("select 1 as a, 'b' as b union select 2, 'c' order by 1")
+        rows = cur.fetchall()
+        self.assertEqual(rows, [[1, 'b'], [2, 'c']])
+        self.assertIsInstance(rows[0], list)
+        cur.execute("select 'a' as a, 'b' as b")
+        row = cur.fetchone()
+        self.assertEqual(row, ['a', 'b'])
+        self.assertIsInstance(row, list)
+
+    def test_build_row_factory_on_instance(self):
+        con = self._connect()
+        cur = con.cursor()
+
+        def build_row_factory():
+            def row_factory(row):
+                row.reverse()
+                return row
+            return row_factory
+
+        cur.build_row_factory = build_row_factory
+        cur.execute("select 1 as a, 'b' as b union select 2, 'c' order by 1")
+        rows = cur.fetchall()
+        self.assertEqual(rows, [['b', 1], ['c', 2]])
+        self.assertIsInstance(rows[0], list)
+        cur.execute("select 'a' as a, 'b' as b")
+        row = cur.fetchone()
+        self.assertEqual(row, ['b', 'a'])
+        self.assertIsInstance(row, list)
+
     def test_change_row_factory_cache_size(self):
         from pg import RowCache
         queries = ['select 1 as a, 2 as b, 3 as c', 'select 123 as abc']
@@ -336,7 +336,19 @@ class TestCopyFrom(TestCopy):
         self.assertIs(ret, self.cursor)
         self.check_table()
         self.assertEqual(len(stream), 0)
-        self.assertEqual(stream.sizes, [8192])
+        self.assertEqual(stream.sizes, [65536])
+        self.check_rowcount()
+
+    def test_copy_size(self):
+        stream = self.data_file
+        self.assertEqual(self.cursor.copy_size, 65536)
+        size = 7
+        self.cursor.copy_size = size
+        num_chunks = (len(stream) + size - 1) // size
+        self.copy_from(stream)
+        self.check_table()
+        self.assertEqual(len(stream), 0)
+        self.assertEqual(stream.sizes, [size] * num_chunks)
         self.check_rowcount()
 
     def test_size_positive(self):